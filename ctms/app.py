@@ -116,7 +116,9 @@ def startup_event():  # pragma: no cover
     configure_logging(settings.use_mozlog, settings.logging_level.name)
     _, SessionLocal = get_db_engine(get_settings())
     METRICS = init_metrics(METRICS_REGISTRY)
-    init_metrics_labels(SessionLocal(), app, METRICS)
+    init_metrics_labels(
+        SessionLocal(), app, METRICS, settings.metrics_client_id_allowlist
+    )
 
 
 def get_db():  # pragma: no cover
@@ -441,7 +443,9 @@ async def log_request_middleware(request: Request, call_next):
         duration_s = round(duration, 3)
         context.update({"status_code": status_code, "duration_s": duration_s})
 
-        emit_response_metrics(context, get_metrics())
+        emit_response_metrics(
+            context, get_metrics(), get_settings().metrics_client_id_allowlist
+        )
         logger = structlog.get_logger("ctms.web")
         if response is None:
             logger.error(log_line, **context)
@@ -14,33 +14,53 @@ from ctms.ingest_stripe import StripeIngestUnknownObjectError, ingest_stripe_obj
 
 logger = logging.getLogger(__name__)
 
+# Number of ingested objects per database transaction
+BATCH_SIZE = 500
 
-def main(db_session: Session, filenames: List[str]) -> None:
+
+def main(
+    db_session: Session, filenames: List[str], batch_size: int = BATCH_SIZE
+) -> None:
     """Load a Stripe object or list of objects from disk."""
 
+    pending = 0
     for filename in filenames:
         logger.info("Reading data from %s...", filename)
         with open(filename, "r", encoding="utf8") as data_file:
             data = json.load(data_file)
 
         if isinstance(data, dict):
-            ingest_object(db_session, data)
+            objs = [data]
         elif isinstance(data, list):
-            for obj in data:
-                if obj:
-                    ingest_object(db_session, obj)
+            objs = [obj for obj in data if obj]
+        else:
+            objs = []
+        for obj in objs:
+            if ingest_object(db_session, obj):
+                pending += 1
+                if pending >= batch_size:
+                    db_session.commit()
+                    pending = 0
+    if pending:
+        db_session.commit()
 
 
 def ingest_object(db_session, obj):
-    """Ingest a Stripe object."""
+    """
+    Ingest a Stripe object.
+
+    The changes are flushed, so that later objects can find this one, but
+    committing is left to the caller. Return True if the object was ingested.
+    """
 
     try:
         ingest_stripe_object(db_session, obj)
     except StripeIngestUnknownObjectError:
         logger.info("Skipping %s %s", obj["object"], obj["id"])
-    else:
-        logger.info("Ingested %s %s", obj["object"], obj["id"])
-        db_session.commit()
+        return False
+    logger.info("Ingested %s %s", obj["object"], obj["id"])
+    db_session.flush()
+    return True
 
 
 def get_parser():
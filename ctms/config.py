@@ -1,7 +1,7 @@
 import re
 from datetime import timedelta
 from enum import Enum
-from typing import Optional
+from typing import Optional, Set
 
 from pydantic import BaseSettings, DirectoryPath, PostgresDsn
 
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     fastapi_env: Optional[str] = None
     is_gunicorn: bool = False
     prometheus_multiproc_dir: Optional[DirectoryPath] = None
+    metrics_client_id_allowlist: Optional[Set[str]] = None
 
     pubsub_audience: Optional[str] = None
     pubsub_email: Optional[str] = None
@@ -628,15 +628,16 @@ def get_api_client_by_id(db: Session, client_id: str):
     return db.query(ApiClient).filter(ApiClient.client_id == client_id).one_or_none()
 
 
-def get_active_api_client_ids(db: Session) -> List[str]:
-    rows = (
+def get_active_api_client_ids(db: Session, limit: Optional[int] = None) -> List[str]:
+    query = (
         db.query(ApiClient)
         .filter(ApiClient.enabled.is_(True))
         .options(load_only("client_id"))
         .order_by("client_id")
-        .all()
     )
-    return [row.client_id for row in rows]
+    if limit:
+        query = query.limit(limit)
+    return [row.client_id for row in query.all()]
 
 
 StripeModel = TypeVar("StripeModel", bound=StripeBase)
@@ -1,7 +1,7 @@
 """Prometheus metrics for instrumentation and monitoring."""
 
 from itertools import product
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, Set, Tuple, Type, cast
 
 from fastapi import FastAPI
 from prometheus_client import CollectorRegistry, Counter, Histogram
@@ -15,18 +15,20 @@ from starlette.routing import Route
 from ctms import config
 from ctms.crud import get_active_api_client_ids
 
-METRICS_PARAMS = {
+# Maximum number of API client IDs to create initial metrics for.
+# Other clients get their metrics on their first request.
+MAX_INIT_CLIENT_IDS = 32
+
+# Status code family ("2xx", "4xx", etc.) for each 3-digit HTTP status code
+_STATUS_CODE_FAMILIES = {code: f"{code // 100}xx" for code in range(100, 1000)}
+
+METRICS_PARAMS: Dict[str, Tuple[Type[MetricWrapperBase], Dict[str, Any]]] = {
     "requests": (
         Counter,
         {
             "name": "ctms_requests_total",
-            "documentation": "Total count of requests by method, path, status code, and status code family.",
-            "labelnames": [
-                "method",
-                "path_template",
-                "status_code",
-                "status_code_family",
-            ],
+            "documentation": "Total count of requests by method, path, and status code family.",
+            "labelnames": ["method", "path_template", "status_code_family"],
         },
     ),
     "requests_duration": (
@@ -35,7 +37,7 @@ METRICS_PARAMS = {
             "name": "ctms_requests_duration_seconds",
             "documentation": "Histogram of requests processing time by path (in seconds)",
             "labelnames": ["method", "path_template", "status_code_family"],
-            "buckets": (0.01, 0.05, 0.1, 0.5, 1, 5, 10, INF),
+            "buckets": (0.05, 0.1, 0.5, 1, 5, INF),
         },
     ),
     "api_requests": (
@@ -92,66 +94,111 @@ def get_metrics_reporting_registry(
     return process_registry
 
 
-def init_metrics(registry: CollectorRegistry) -> Dict[str, MetricWrapperBase]:
-    """Initialize the metrics with the registry."""
-    metrics = {}
+def init_metrics(registry: CollectorRegistry) -> Dict[str, Any]:
+    """
+    Initialize the metrics with the registry.
+
+    Labeled metrics get a companion "_<name>_children" cache, filled by
+    get_metric_child().
+    """
+    metrics: Dict[str, Any] = {}
     for name, init_bits in METRICS_PARAMS.items():
         metric_type, params = init_bits
         metrics[name] = metric_type(registry=registry, **params)
+        if "labelnames" in params:
+            metrics[f"_{name}_children"] = {}
     return metrics
 
 
+def get_metric_child(
+    metrics: Dict[str, Any], name: str, *labelvalues: str
+) -> MetricWrapperBase:
+    """
+    Get the child metric for the label values.
+
+    prometheus_client's .labels() validates and converts the label values and
+    takes a lock on every call. The children are cached by label values so
+    that emitting a metric for a known combination is a dict lookup.
+    """
+    children = cast(
+        Dict[Tuple[str, ...], MetricWrapperBase], metrics[f"_{name}_children"]
+    )
+    child = children.get(labelvalues)
+    if child is None:
+        child = children[labelvalues] = metrics[name].labels(*labelvalues)
+    return child
+
+
 def init_metrics_labels(
-    dbsession: Session, app: FastAPI, metrics: Dict[str, MetricWrapperBase]
+    dbsession: Session,
+    app: FastAPI,
+    metrics: Dict[str, Any],
+    client_id_allowlist: Optional[Set[str]] = None,
 ) -> None:
-    """Create the initial metric combinations."""
-    openapi = app.openapi()
-    client_ids = get_active_api_client_ids(dbsession) or ["none"]
-    request_metric = metrics["requests"]
-    timing_metric = metrics["requests_duration"]
-    api_request_metric = metrics["api_requests"]
+    """
+    Create the initial metric combinations.
+
+    If client_id_allowlist is set, only those API clients get initial metrics.
+    """
+    openapi_paths = app.openapi()["paths"]
+    if client_id_allowlist is None:
+        client_ids = get_active_api_client_ids(dbsession, limit=MAX_INIT_CLIENT_IDS)
+    else:
+        client_ids = [
+            client_id
+            for client_id in get_active_api_client_ids(dbsession)
+            if client_id in client_id_allowlist
+        ]
+    if not client_ids:
+        client_ids = ["none"]
     for route in app.routes:
         assert isinstance(route, Route)
         route = cast(Route, route)  # Route defines.methods and .path_format
-        methods = list(route.methods)
+        methods = tuple(route.methods)
+        methods_set = frozenset(methods)
         path = route.path_format
 
-        api_spec = openapi["paths"].get(path)
+        api_spec = openapi_paths.get(path)
         is_api = False
         if api_spec:
-            status_codes = []
+            status_codes: Set[int] = set()
             for method_lower, mspec in api_spec.items():
-                if method_lower.upper() in methods:
-                    status_codes.extend(
-                        [int(code) for code in list(mspec.get("responses", [200]))]
-                    )
+                if method_lower.upper() in methods_set:
+                    responses = mspec.get("responses") or (200,)
+                    status_codes.update(int(code) for code in responses)
                     is_api |= "security" in mspec and not path.endswith("from_pubsub")
         elif path == "/":
-            status_codes = [307]
+            status_codes = {307}
         else:
-            status_codes = [200]
-        status_code_families = sorted({str(code)[0] + "xx" for code in status_codes})
-
-        for combo in product(methods, status_codes):
-            method, status_code = combo
-            status_code_family = str(status_code)[0] + "xx"
-            request_metric.labels(method, path, status_code, status_code_family)
-        for time_combo in product(methods, status_code_families):
-            method, status_code_family = time_combo
-            timing_metric.labels(method, path, status_code_family)
+            status_codes = {200}
+        status_code_families = sorted(
+            {_STATUS_CODE_FAMILIES[code] for code in status_codes}
+        )
+
+        # Label values, in the order of the metrics' labelnames
+        for method, status_code_family in product(methods, status_code_families):
+            combo = (method, path, status_code_family)
+            get_metric_child(metrics, "requests", *combo)
+            get_metric_child(metrics, "requests_duration", *combo)
         if is_api:
-            for api_combo in product(methods, status_code_families):
-                method, status_code_family = api_combo
-                for client_id in client_ids:
-                    api_request_metric.labels(
-                        method, path, client_id, status_code_family
-                    )
+            for method, client_id, status_code_family in product(
+                methods, client_ids, status_code_families
+            ):
+                api_combo = (method, path, client_id, status_code_family)
+                get_metric_child(metrics, "api_requests", *api_combo)
 
 
 def emit_response_metrics(
-    context: Dict[str, Any], metrics: Dict[str, MetricWrapperBase]
+    context: Dict[str, Any],
+    metrics: Dict[str, Any],
+    client_id_allowlist: Optional[Set[str]] = None,
 ) -> None:
-    """Emit metrics for a response."""
+    """
+    Emit metrics for a response.
+
+    If client_id_allowlist is set, other API clients are counted as "other",
+    so that the number of client_id labels stays bounded.
+    """
     if not metrics:
         return
 
@@ -164,26 +211,24 @@ def emit_response_metrics(
     method = context["method"]
     duration_s = context["duration_s"]
     status_code = context["status_code"]
-    status_code_family = str(status_code)[0] + "xx"
+    status_code_family = _STATUS_CODE_FAMILIES[status_code]
 
-    metrics["requests"].labels(
-        method=method,
-        path_template=path_template,
-        status_code=status_code,
-        status_code_family=status_code_family,
+    get_metric_child(
+        metrics, "requests", method, path_template, status_code_family
     ).inc()
-
-    metrics["requests_duration"].labels(
-        method=method,
-        path_template=path_template,
-        status_code_family=status_code_family,
+    get_metric_child(
+        metrics, "requests_duration", method, path_template, status_code_family
     ).observe(duration_s)
 
     client_id = context.get("client_id")
     if client_id:
-        metrics["api_requests"].labels(
-            method=method,
-            path_template=path_template,
-            client_id=client_id,
-            status_code_family=status_code_family,
+        if client_id_allowlist is not None and client_id not in client_id_allowlist:
+            client_id = "other"
+        get_metric_child(
+            metrics,
+            "api_requests",
+            method,
+            path_template,
+            client_id,
+            status_code_family,
         ).inc()
@@ -430,6 +430,15 @@ class StripeInvoiceLineItem(StripeBase):
         server_onupdate=now(),
     )
 
+    # Indexes
+    __table_args__ = (
+        Index(
+            "ix_stripe_invoice_line_item_invoice_price",
+            "stripe_invoice_id",
+            "stripe_price_id",
+        ),
+    )
+
     invoice = relationship("StripeInvoice", back_populates="line_items", uselist=False)
     price = relationship(
         "StripePrice", back_populates="invoice_line_items", uselist=False
@@ -1,9 +1,9 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime
 from typing import Optional
 
 from pydantic import UUID4, Field, validator
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 from .email import EMAIL_ID_DESCRIPTION, EMAIL_ID_EXAMPLE
 
 
@@ -85,7 +85,7 @@ AddOnsInSchema = AddOnsBase
 
 class UpdatedAddOnsInSchema(AddOnsInSchema):
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="AMO data update timestamp",
         example="2021-01-28T21:26:57.511Z",
     )
@@ -1,5 +1,11 @@
+from datetime import datetime, timezone
+from functools import partial
+
 from pydantic import BaseModel
 
+# The current time in UTC, for default_factory of timestamp fields
+utc_now = partial(datetime.now, timezone.utc)
+
 
 class ComparableBase(BaseModel):
     def is_default(self):
@@ -1,10 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import UUID4, Field, validator
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 
 EMAIL_ID_DESCRIPTION = "ID for email"
 EMAIL_ID_EXAMPLE = "332de237-cab7-4461-bcc3-48e68f42bd5c"
@@ -138,7 +138,7 @@ class EmailPatchSchema(EmailInSchema):
 
 class UpdatedEmailPutSchema(EmailPutSchema):
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="Contact last modified date, LastModifiedDate in Salesforce",
         example="2021-01-28T21:26:57.511Z",
     )
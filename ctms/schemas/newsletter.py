@@ -1,9 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Literal, Optional
 
 from pydantic import UUID4, Field, HttpUrl
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 from .email import EMAIL_ID_DESCRIPTION, EMAIL_ID_EXAMPLE
 
 
@@ -49,7 +49,7 @@ NewsletterSchema = NewsletterBase
 
 class UpdatedNewsletterInSchema(NewsletterInSchema):
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="Newsletter subscription data update timestamp",
         example="2021-01-28T21:26:57.511Z",
     )
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 from pydantic import Field
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 
 
 class StripeCustomerBase(ComparableBase):
@@ -80,7 +80,7 @@ StripeCustomerUpsertSchema = StripeCustomerCreateSchema
 class StripeCustomerOutputSchema(StripeCustomerUpsertSchema):
     create_timestamp: datetime
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
     )
 
     class Config:
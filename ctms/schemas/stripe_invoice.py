@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from pydantic import Field
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 from .stripe_price import StripeCurrencyType
 
 
@@ -107,7 +107,7 @@ StripeInvoiceUpsertSchema = StripeInvoiceCreateSchema
 class StripeInvoiceOutputSchema(StripeInvoiceUpsertSchema):
     create_timestamp: datetime
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
     )
 
     class Config:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from pydantic import Field
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 
 
 class StripeInvoiceLineTypeEnum(str, Enum):
@@ -118,7 +118,7 @@ StripeInvoiceLineItemUpsertSchema = StripeInvoiceLineItemCreateSchema
 class StripeInvoiceLineItemOutputSchema(StripeInvoiceLineItemUpsertSchema):
     create_timestamp: datetime
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
     )
 
     class Config:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from pydantic import Field
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 
 
 class StripeSubscriptionStatusEnum(str, Enum):
@@ -149,7 +149,7 @@ StripeSubscriptionUpsertSchema = StripeSubscriptionCreateSchema
 class StripeSubscriptionOutputSchema(StripeSubscriptionUpsertSchema):
     create_timestamp: datetime
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
     )
 
     class Config:
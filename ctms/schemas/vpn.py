@@ -1,9 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 from pydantic import UUID4, Field
 
-from .base import ComparableBase
+from .base import ComparableBase, utc_now
 from .email import EMAIL_ID_DESCRIPTION, EMAIL_ID_EXAMPLE
 
 
@@ -42,7 +42,7 @@ VpnWaitlistSchema = VpnWaitlistBase
 
 class UpdatedVpnWaitlistInSchema(VpnWaitlistInSchema):
     update_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="VPN Waitlist data update timestamp",
         example="2021-01-28T21:26:57.511Z",
     )
@@ -6,8 +6,9 @@ set -e
 . /opt/pysetup/.venv/bin/activate
 
 # setup an empty directory for Prometheus metrics
+# It is in /dev/shm (tmpfs), because every scrape reads all the worker files
 if [ ${PROMETHEUS_MULTIPROC:-0} -eq 1 ]; then
-    prometheus_multiproc_dir=`mktemp -td prometheus.XXXXXXXXXX` || exit 1
+    prometheus_multiproc_dir=`mktemp -d -p /dev/shm prometheus.XXXXXXXXXX` || exit 1
     export prometheus_multiproc_dir
 fi
 
@@ -388,7 +388,7 @@ def contact_with_stripe_customer(dbsession, example_contact):
     create_stripe_customer(
         dbsession, StripeCustomerCreateSchema(**SAMPLE_STRIPE_DATA["Customer"])
     )
-    dbsession.commit()
+    dbsession.flush()
     return example_contact
 
 
@@ -404,7 +404,7 @@ def contact_with_stripe_subscription(dbsession, contact_with_stripe_customer):
         dbsession,
         StripeSubscriptionItemCreateSchema(**SAMPLE_STRIPE_DATA["SubscriptionItem"]),
     )
-    dbsession.commit()
+    dbsession.flush()
     email = get_email(dbsession, contact_with_stripe_customer.email.email_id)
     contact_with_stripe_customer.products = get_stripe_products(email)
     return contact_with_stripe_customer
@@ -9,6 +9,7 @@ import sqlalchemy.event
 
 from ctms.crud import (
     create_amo,
+    create_api_client,
     create_email,
     create_fxa,
     create_mofo,
@@ -21,6 +22,7 @@ from ctms.crud import (
     create_stripe_subscription_item,
     delete_acoustic_record,
     get_acoustic_record_as_contact,
+    get_active_api_client_ids,
     get_all_acoustic_records_before,
     get_bulk_contacts,
     get_contact_by_email_id,
@@ -35,6 +37,7 @@ from ctms.crud import (
 from ctms.models import Email, PendingAcousticRecord
 from ctms.schemas import (
     AddOnsInSchema,
+    ApiClientSchema,
     EmailInSchema,
     FirefoxAccountsInSchema,
     MozillaFoundationInSchema,
@@ -1103,3 +1106,16 @@ def test_relations_on_stripe_subscription_items(
     assert subscription_item.subscription == subscription
     assert subscription_item.price == price
     assert subscription_item.get_email_id() == email_id
+
+
+@pytest.mark.parametrize("limit,expected", ((None, ["id_a", "id_c"]), (1, ["id_a"])))
+def test_get_active_api_client_ids(dbsession, limit, expected):
+    """get_active_api_client_ids() returns enabled client IDs, up to the limit."""
+    for client_id, enabled in (("id_c", True), ("id_b", False), ("id_a", True)):
+        api_client = ApiClientSchema(
+            client_id=client_id, email=f"{client_id}@example.com", enabled=enabled
+        )
+        create_api_client(dbsession, api_client, "a_secret")
+    dbsession.flush()
+
+    assert get_active_api_client_ids(dbsession, limit=limit) == expected
@@ -1,4 +1,5 @@
 # Test for metrics
+from functools import lru_cache
 from unittest.mock import Mock, patch
 
 import pytest
@@ -10,6 +11,8 @@ from structlog.testing import capture_logs
 
 from ctms.app import app
 from ctms.metrics import (
+    emit_response_metrics,
+    get_metric_child,
     get_metrics_reporting_registry,
     init_metrics,
     init_metrics_labels,
@@ -20,11 +23,11 @@ from ctms.metrics import (
 # Higher numbers = more ways to slice data, more storage, more processing time for summaries
 
 # Cardinality of ctms_requests_total counter
-METHOD_PATH_CODE_COMBINATIONS = 50
+# Also the base cardinality of ctms_requests_duration_seconds histogram
+METHOD_PATH_CODEFAM_COMBOS = 36
 
 # Cardinality of ctms_requests_duration_seconds histogram
-METHOD_PATH_CODEFAM_COMBOS = 36
-DURATION_BUCKETS = 8
+DURATION_BUCKETS = 6
 DURATION_COMBINATIONS = METHOD_PATH_CODEFAM_COMBOS * (DURATION_BUCKETS + 2)
 
 # Base cardinatility of ctms_api_requests_total
@@ -92,49 +95,54 @@ def test_get_metrics_reporting_registry_settings_error():
     assert not the_registry._collector_to_names  # pylint: disable=protected-access
 
 
+def test_get_metric_child(metrics):
+    """get_metric_child() reuses the child metric for the same label values."""
+    child = get_metric_child(metrics, "requests", "GET", "/", "3xx")
+    assert child is metrics["requests"].labels("GET", "/", "3xx")
+    assert get_metric_child(metrics, "requests", "GET", "/", "3xx") is child
+    assert metrics["_requests_children"] == {("GET", "/", "3xx"): child}
+
+
 def test_init_metrics_labels(dbsession, client_id_and_secret, registry, metrics):
     """Test that init_metric_labels populates variants"""
     init_metrics_labels(dbsession, app, metrics)
 
     metrics_text = generate_latest(registry).decode()
-    families = list(text_string_to_metric_families(metrics_text))
-    metrics_by_name = {
-        "ctms_requests": None,
-        "ctms_requests_created": None,
-        "ctms_requests_duration_seconds": None,
-        "ctms_requests_duration_seconds_created": None,
-        "ctms_api_requests": None,
-        "ctms_api_requests_created": None,
+    wanted = {
+        "ctms_requests",
+        "ctms_requests_created",
+        "ctms_requests_duration_seconds",
+        "ctms_requests_duration_seconds_created",
+        "ctms_api_requests",
+        "ctms_api_requests_created",
     }
-    for metric in families:
-        if metric.name in metrics_by_name:
-            metrics_by_name[metric.name] = metric
-    not_found = [name for name, metric in metrics_by_name.items() if metric is None]
-    assert not_found == []
+    samples_by_name = {}
+    for family in text_string_to_metric_families(metrics_text):
+        if family.name in wanted:
+            samples_by_name[family.name] = family.samples
+            wanted.discard(family.name)
+            if not wanted:
+                break
+    assert not wanted, wanted
 
     def get_labels(metric_name, label_names):
-        labels = []
-        for sample in metrics_by_name[metric_name].samples:
-            sample_label = sample[1]
-            label = tuple(sample_label[name] for name in label_names)
-            labels.append(label)
-        return sorted(labels)
-
-    # ctms_requests has a metric for every method / path / status code combo
-    req_label_names = ("method", "path_template", "status_code")
+        return sorted(
+            tuple(sample.labels[name] for name in label_names)
+            for sample in samples_by_name[metric_name]
+        )
+
+    # ctms_requests has a metric for every method / path / status code family combo
+    req_label_names = ("method", "path_template", "status_code_family")
     req_labels = get_labels("ctms_requests", req_label_names)
     reqc_labels = get_labels("ctms_requests_created", req_label_names)
-    assert len(req_labels) == METHOD_PATH_CODE_COMBINATIONS
+    assert len(req_labels) == METHOD_PATH_CODEFAM_COMBOS
     assert req_labels == reqc_labels
-    assert ("GET", "/", "307") in req_labels
-    assert ("GET", "/openapi.json", "200") in req_labels
-    assert ("GET", "/ctms/{email_id}", "200") in req_labels
-    assert ("GET", "/ctms/{email_id}", "401") in req_labels
-    assert ("GET", "/ctms/{email_id}", "404") in req_labels
-    assert ("GET", "/ctms/{email_id}", "422") in req_labels
-    assert ("GET", "/ctms/{email_id}", "422") in req_labels
-    assert ("PATCH", "/ctms/{email_id}", "200") in req_labels
-    assert ("PUT", "/ctms/{email_id}", "200") in req_labels
+    assert ("GET", "/", "3xx") in req_labels
+    assert ("GET", "/openapi.json", "2xx") in req_labels
+    assert ("GET", "/ctms/{email_id}", "2xx") in req_labels
+    assert ("GET", "/ctms/{email_id}", "4xx") in req_labels
+    assert ("PATCH", "/ctms/{email_id}", "2xx") in req_labels
+    assert ("PUT", "/ctms/{email_id}", "2xx") in req_labels
 
     # ctms_requests_duration_seconds has a metric for each
     # method / path / status code family combo
@@ -156,6 +164,45 @@ def test_init_metrics_labels(dbsession, client_id_and_secret, registry, metrics)
     assert ("GET", "/ctms/{email_id}", client_id, "4xx") in api_labels
 
 
+def test_init_metrics_labels_client_id_allowlist(
+    dbsession, client_id_and_secret, registry, metrics
+):
+    """init_metric_labels only populates API client IDs in the allowlist."""
+    client_id, _ = client_id_and_secret
+    init_metrics_labels(dbsession, app, metrics, {client_id, "unknown_client"})
+
+    api_client_ids = set()
+    for family in registry.collect():
+        if family.name == "ctms_api_requests":
+            api_client_ids.update(
+                sample.labels["client_id"] for sample in family.samples
+            )
+    assert api_client_ids == {client_id}
+
+
+@lru_cache(maxsize=None)
+def _request_labels(method: str, path_template: str, status_code_family: str):
+    """Labels for ctms_requests_total and ctms_requests_duration_seconds"""
+    return {
+        "method": method,
+        "path_template": path_template,
+        "status_code_family": status_code_family,
+    }
+
+
+@lru_cache(maxsize=None)
+def _api_request_labels(
+    method: str, path_template: str, client_id: str, status_code_family: str
+):
+    """Labels for ctms_api_requests_total"""
+    return {
+        "method": method,
+        "path_template": path_template,
+        "client_id": client_id,
+        "status_code_family": status_code_family,
+    }
+
+
 def assert_request_metric_inc(
     metrics_registry: CollectorRegistry,
     method: str,
@@ -164,12 +211,7 @@ def assert_request_metric_inc(
     count: int = 1,
 ):
     """Assert ctms_requests_total with given labels was incremented"""
-    labels = {
-        "method": method,
-        "path_template": path_template,
-        "status_code": str(status_code),
-        "status_code_family": str(status_code)[0] + "xx",
-    }
+    labels = _request_labels(method, path_template, str(status_code)[0] + "xx")
     assert metrics_registry.get_sample_value("ctms_requests_total", labels) == count
 
 
@@ -183,13 +225,8 @@ def assert_duration_metric_obs(
 ):
     """Assert ctms_requests_duration_seconds with given labels was observed"""
     base_name = "ctms_requests_duration_seconds"
-    labels = {
-        "method": method,
-        "path_template": path_template,
-        "status_code_family": status_code_family,
-    }
-    bucket_labels = labels.copy()
-    bucket_labels["le"] = str(limit)
+    labels = _request_labels(method, path_template, status_code_family)
+    bucket_labels = {**labels, "le": str(limit)}
     assert (
         metrics_registry.get_sample_value(f"{base_name}_bucket", bucket_labels) == count
     )
@@ -206,12 +243,7 @@ def assert_api_request_metric_inc(
     count: int = 1,
 ):
     """Assert ctms_api_requests_total with given labels was incremented"""
-    labels = {
-        "method": method,
-        "path_template": path_template,
-        "client_id": client_id,
-        "status_code_family": status_code_family,
-    }
+    labels = _api_request_labels(method, path_template, client_id, status_code_family)
     assert metrics_registry.get_sample_value("ctms_api_requests_total", labels) == count
 
 
@@ -257,6 +289,27 @@ def test_pending_sync(client, minimal_contact, registry):
     assert_pending_acoustic_sync_inc(registry)
 
 
+def test_api_request_client_id_allowlist(metrics, registry):
+    """API clients not in the allowlist are counted as "other"."""
+    path = "/ctms/{email_id}"
+    context = {
+        "method": "GET",
+        "path_template": path,
+        "status_code": 200,
+        "duration_s": 0.01,
+    }
+    emit_response_metrics(
+        {**context, "client_id": "test_client"}, metrics, {"test_client"}
+    )
+    emit_response_metrics(
+        {**context, "client_id": "new_client"}, metrics, {"test_client"}
+    )
+    assert_api_request_metric_inc(registry, "GET", path, "test_client", "2xx")
+    assert_api_request_metric_inc(registry, "GET", path, "other", "2xx")
+    labels = _api_request_labels("GET", path, "new_client", "2xx")
+    assert registry.get_sample_value("ctms_api_requests_total", labels) is None
+
+
 @pytest.mark.parametrize(
     "email_id,status_code",
     (
@@ -290,18 +343,14 @@ def test_unknown_path(anon_client, dbsession, registry):
     path = "/unknown"
     resp = anon_client.get(path)
     assert resp.status_code == 404
-    metrics_text = generate_latest(registry).decode()
-    for family in text_string_to_metric_families(metrics_text):
-        if len(family.samples) == 1:
-            # This metric is emitted, maybe because there are no labels
-            sample = family.samples[0]
+    for family in registry.collect():
+        for sample in family.samples:
+            # Only metrics without labels are emitted
             assert sample.name in (
                 "ctms_pending_acoustic_sync_total",
                 "ctms_pending_acoustic_sync_created",
             )
             assert sample.labels == {}
-        else:
-            assert len(family.samples) == 0
 
 
 def test_get_metrics(anon_client, setup_metrics):